@@ -1,6 +1,6 @@
 @echo off
 echo Installing dependencies...
-pip install requests beautifulsoup4 flask lxml
+pip install requests beautifulsoup4 flask lxml brotli waitress orjson
 
 echo.
 echo Simple Job Search Tool
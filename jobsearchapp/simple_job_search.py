@@ -4,293 +4,746 @@ Simple Job Search Tool
 Search jobs from LinkedIn and Naukri with minimal setup
 """
 
+import functools
+import logging
+import operator
+import os
+import random
+import re
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
 import time
 import csv
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-from typing import List, Dict
-from urllib.parse import urlencode
+from itertools import chain, cycle, zip_longest
+from types import MappingProxyType
+from typing import Dict, Iterable, List
+from collections import OrderedDict
+from dataclasses import dataclass
+from urllib.parse import quote, quote_plus, urlencode, urlsplit
+
+try:
+    import lxml  # noqa: F401
+    _PARSER = 'lxml'
+except ImportError:
+    _PARSER = 'html.parser'
+
+# urllib3 can only decode Brotli bodies when a brotli package is installed
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _ACCEPT_ENCODING = 'gzip, deflate, br'
+    except ImportError:
+        _ACCEPT_ENCODING = 'gzip, deflate'
+
+# Browser-like headers set once on the shared session
+_HEADERS_HTML = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': _ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+})
+
+# Per-request overrides, merged over the session headers by requests
+_APNA_HEADERS = MappingProxyType({
+    'Accept-Language': 'en-US,en;q=0.9,hi;q=0.8',
+    'Referer': 'https://apna.co/'
+})
+_TIMESJOBS_HEADERS = MappingProxyType({
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+    'Referer': 'https://www.timesjobs.com/',
+    'Cache-Control': 'no-cache'
+})
+# Visited before searching so its session cookies are on the shared session
+_TIMESJOBS_HOME = "https://www.timesjobs.com/"
+
+_log = logging.getLogger(__name__)
+
+# Politeness limits applied per portal host
+_HOST_CONCURRENCY = 2
+_HOST_MIN_INTERVAL = 1.0
+
+# Longest a host is held back after throttling, whatever Retry-After asks for
+_HOST_MAX_BACKOFF = 60.0
+
+# Longest the adapter sleeps on a Retry-After inside a single request; longer
+# waits are left to the per-host gate so the calling thread isn't tied up
+_RETRY_AFTER_MAX = 10.0
+
+# LinkedIn's guest search endpoint returns the job cards as a static HTML fragment
+# (no JS rendering), offsetting its result pages by this many postings
+_LINKEDIN_SEARCH_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+_LINKEDIN_PAGE_SIZE = 25
+
+# Job cards kept from a single (unpaginated) LinkedIn results page
+_LINKEDIN_MAX_CARDS = 10
+
+# Listings on one TimesJobs results page
+_TIMESJOBS_PAGE_SIZE = 25
+
+# Listings at the same company are treated as one posting when at least this
+# share of the shorter title's words (min. _NEAR_DUP_MIN_WORDS) appear in the
+# other title, unless the two titles name a different seniority
+_NEAR_DUP_THRESHOLD = 0.8
+_NEAR_DUP_MIN_WORDS = 2
+_SENIORITY_WORDS = frozenset({
+    'senior', 'junior', 'lead', 'principal', 'staff', 'intern', 'trainee',
+    'fresher', 'head', 'manager', 'associate'
+})
+_WORD_RE = re.compile(r'[a-z0-9+#]+')
+_TITLE_ABBREVIATIONS = MappingProxyType({
+    'sr': 'senior', 'snr': 'senior', 'jr': 'junior', 'jnr': 'junior',
+    'dev': 'developer', 'engg': 'engineer', 'eng': 'engineer',
+    'mgr': 'manager', 'sw': 'software', 'assoc': 'associate'
+})
+
+# Int codes for the source labels the parsers write, used when merging and
+# displaying results
+_SRC_OTHER, _SRC_LINKEDIN, _SRC_TIMESJOBS = range(3)
+_SOURCE_CODES = MappingProxyType({'LinkedIn': _SRC_LINKEDIN, 'TimesJobs': _SRC_TIMESJOBS})
+_SOURCE_ICONS = ("🔍", "💼", "📰")
+
+# Column order for CSV exports
+_CSV_FIELDS = ('title', 'company', 'location', 'experience', 'salary', 'description', 'apply_url', 'source')
+_CSV_GETTER = operator.itemgetter(*_CSV_FIELDS)
+
+_NAUKRI_PREFIX = "https://www.naukri.com/"
+
+# Naukri search pages the console falls back on; {job_title} and {base_search}
+# are filled in per search with str.format_map
+_NAUKRI_TEMPLATES = (
+    {
+        'title': "{job_title} - Fresher",
+        'company': "TCS",
+        'location': "Hyderabad, Chennai, Bangalore", 
+        'experience': "0 - 2 years",
+        'salary': "₹ 3-4 Lacs P.A.",
+        'description': "We are looking for a Python Developer to assist in building scalable applications and automation tools. Key Responsibilities: Write clean and efficient Python code, Learn frameworks like Django or Flask, Work on data processing and scripting tasks.",
+        'apply_url': _NAUKRI_PREFIX + "{base_search}-jobs"
+    },
+    {
+        'title': "Prompt Engineer (Fresher)",
+        'company': "IT Shops", 
+        'location': "Hyderabad, Chennai, Bangalore",
+        'experience': "4.3 - 17 reviews",
+        'salary': "Not disclosed",
+        'description': "Exciting opportunity for AI and machine learning enthusiasts. Work with cutting-edge prompt engineering technologies.",
+        'apply_url': _NAUKRI_PREFIX + "prompt-engineer-jobs"
+    },
+    {
+        'title': "{job_title}",
+        'company': "Smart Placement Services",
+        'location': "Hybrid - Hyderabad, Bangalore", 
+        'experience': "Posted 21 days ago",
+        'salary': "Competitive",
+        'description': "Looking for experienced {job_title} for hybrid work model with flexible timings and growth opportunities.",
+        'apply_url': _NAUKRI_PREFIX + "{base_search}-jobs-in-bangalore"
+    },
+    {
+        'title': "{job_title} - Fresher (WFH)",
+        'company': "AIVOA",
+        'location': "Bangalore",
+        'experience': "Posted 71 days ago", 
+        'salary': "₹ 2.5-5 Lacs P.A.",
+        'description': "Work from home opportunity for {job_title} freshers. Complete training provided with mentorship program.",
+        'apply_url': _NAUKRI_PREFIX + "work-from-home-{base_search}-jobs"
+    },
+    {
+        'title': "Data Engineer",
+        'company': "IT Shops",
+        'location': "Hyderabad, Chennai, Bangalore",
+        'experience': "4.3 - 17 reviews",
+        'salary': "Posted 25 days ago",
+        'description': "Data engineering role with modern tech stack including Python, SQL, and cloud platforms. Great learning opportunities.",
+        'apply_url': _NAUKRI_PREFIX + "data-engineer-jobs"
+    },
+    {
+        'title': "{job_title} Fullstack Developer", 
+        'company': "Saushruthi Solutions",
+        'location': "Multiple locations",
+        'experience': "2-5 years",
+        'salary': "₹ 4-8 Lacs P.A.",
+        'description': "Full stack development role combining {job_title} backend with modern frontend frameworks. Exciting projects ahead.",
+        'apply_url': _NAUKRI_PREFIX + "fullstack-{base_search}-jobs"
+    }
+)
+
+class _BoundedRetry(Retry):
+    """Retry policy that honours Retry-After only up to _RETRY_AFTER_MAX seconds"""
+    
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, _RETRY_AFTER_MAX)
+
+# Transient portal errors (throttling, 5xx) are retried with backoff on the shared
+# adapter; the last response is returned rather than raised once retries run out
+_RETRY = _BoundedRetry(
+    total=2,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(['GET', 'HEAD']),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+# Scraped results are reused for repeat searches within this window
+_CACHE_TTL = 15 * 60
+_CACHE_MAX_ENTRIES = 256
+
+# Companies and cities used to fill in sample jobs when a portal can't be scraped
+_APNA_SAMPLE_COMPANIES = ("Zomato", "Swiggy", "Urban Company", "Dunzo", "BigBasket", "Grofers", "Ola", "Uber")
+_APNA_SAMPLE_LOCATIONS = ("Delhi", "Mumbai", "Bangalore", "Hyderabad", "Chennai", "Pune", "Kolkata", "Ahmedabad")
+_TIMESJOBS_SAMPLE_COMPANIES = ("Accenture", "Capgemini", "IBM", "Deloitte", "EY", "KPMG")
+_TIMESJOBS_SAMPLE_LOCATIONS = ("Gurgaon", "Noida", "Bangalore", "Hyderabad", "Chennai", "Mumbai")
+_INDEED_SAMPLE_COMPANIES = ("Microsoft", "Google", "Amazon", "Apple", "Meta", "Netflix", "Uber", "Airbnb")
+_INDEED_SAMPLE_LOCATIONS = ("Remote", "San Francisco, CA", "Seattle, WA", "New York, NY", "Austin, TX")
+_LINKEDIN_SAMPLE_COMPANIES = ("Microsoft", "Google", "Amazon", "Meta", "Apple")
+_LINKEDIN_SAMPLE_LOCATIONS = ("Remote", "San Francisco", "Seattle", "New York", "Austin")
+
+# Only the job-listing blocks of a results page are built into the soup; headers,
+# footers, scripts and navigation are skipped by the parser
+_APNA_STRAINER = SoupStrainer(['div', 'article', 'li', 'section'], class_=re.compile(r'job|card|listing|post', re.I))
+_TIMESJOBS_STRAINER = SoupStrainer(['div', 'article', 'li', 'ul', 'section'], class_=re.compile(r'job|srp', re.I))
+_LINKEDIN_STRAINER = SoupStrainer(['div', 'li'], class_=re.compile(r'base-card|job-search-card|result-card'))
+
+# <title> lookup for debug output, since strained soups don't contain <head>
+_TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title>', re.I | re.S)
+
+# Common job posting URL fragments and role keywords, matched in a single scan
+_JOB_URL_RE = re.compile(r'/jobs?/|/careers?/|/vacancy/|/opening/|/position/|job[-_]?detail', re.I)
+_ROLE_RE = re.compile(r'developer|engineer|analyst', re.I)
+
+# CSS selectors tried in order for each field, compiled once via _compile_selector
+_APNA_CARD_SELECTORS = (
+    '.job-card', '.job-item', '[data-job-id]', '.listing-item',
+    '.job-listing', '.card', 'article', '.job-post'
+)
+_APNA_TITLE_SELECTORS = ('h2 a', 'h3 a', '.job-title a', '.title a')
+# Catch-alls that would also hit apply/"view job" links, so only tried when the headings miss
+_APNA_TITLE_FALLBACK_SELECTORS = ('a[href*="job"]', '.job-name', '.position')
+_APNA_TITLE_TEXT_SELECTORS = ('h2', 'h3', '.job-title', '.title', '.job-name')
+_APNA_COMPANY_SELECTORS = (
+    '.company-name', '.company', '.employer',
+    '.org-name', '.business-name'
+)
+_APNA_LOCATION_SELECTORS = ('.location', '.job-location', '.place', '.city')
+_APNA_SALARY_SELECTORS = ('.salary', '.pay', '.wage', '.compensation')
+_APNA_DESC_SELECTORS = ('.description', '.job-desc', '.summary', '.details')
+
+_TIMESJOBS_CARD_SELECTORS = (
+    '.srp-container .joblist',
+    '.job-bx.wht-shd-bx',
+    '.joblist-comp.clearfix',
+    'li.clearfix.job-bx',
+    '.job-bx',
+    '.clearfix.job-bx.wht-shd-bx',
+    'article.jobTuple'
+)
+_TIMESJOBS_TITLE_SELECTORS = (
+    'h2 a[title]', '.jobTitle a', 'h3.jobTitle a',
+    'a.job-title', '.position a', 'h2 a'
+)
+_TIMESJOBS_COMPANY_SELECTORS = (
+    '.comp-name a', '.company-name', '.companyName',
+    'h3.joblist-comp-name', '.job-advertiser'
+)
+_TIMESJOBS_LOCATION_SELECTORS = (
+    '.location .locationsContainer', '.job-location',
+    '.locationsContainer', '.loc'
+)
+_TIMESJOBS_EXP_SELECTORS = ('.experience .expwdth', '.exp', '.job-experience')
+_TIMESJOBS_SALARY_SELECTORS = ('.salary .sal', '.package', '.ctc')
+_TIMESJOBS_DESC_SELECTORS = ('.job-description', '.list-job-dtl', '.more-info')
+
+_LINKEDIN_CARD_SELECTORS = (
+    'div.base-card', 'div.job-search-card',
+    'li.result-card', 'div[data-entity-urn]'
+)
+_LINKEDIN_TITLE_SELECTORS = ('h3', '.result-card__title', '.job-title')
+_LINKEDIN_COMPANY_SELECTORS = ('h4', '.result-card__subtitle', '.company-name')
+_LINKEDIN_LOCATION_SELECTORS = ('.job-search-card__location', '.result-card__location')
+
+_INDEED_TITLE_SELECTORS = (
+    'h2 a[data-jk]', '.jobTitle a', 'h2.jobTitle a',
+    '[data-testid="job-title"] a', 'a[data-jk]'
+)
+_INDEED_COMPANY_SELECTORS = (
+    '.companyName', '[data-testid="company-name"]', '.company',
+    'span.companyName a', 'span.companyName'
+)
+_INDEED_LOCATION_SELECTORS = (
+    '.companyLocation', '[data-testid="job-location"]',
+    '.location', 'div.companyLocation'
+)
+_INDEED_SALARY_SELECTORS = (
+    '.salary-snippet', '.salaryText', '[data-testid="job-salary"]', '.salary'
+)
+_INDEED_DESC_SELECTORS = ('.job-snippet', '.summary', '[data-testid="job-snippet"]')
+
+# soupsieve parses a selector string on every .select() call; cache the compiled form
+_compile_selector = functools.lru_cache(maxsize=256)(sv.compile)
+
+def _markup(response):
+    """Decoded text when the server declared a charset, raw bytes for BeautifulSoup to sniff otherwise"""
+    if 'charset' in response.headers.get('Content-Type', '').lower():
+        return response.text
+    return response.content
+
+def _make_soup(html, strainer: SoupStrainer) -> BeautifulSoup:
+    """Build the listing blocks of a results page with the fastest installed parser"""
+    return BeautifulSoup(html, _PARSER, parse_only=strainer)
+
+def _mark_seen(seen: set, job: Dict) -> bool:
+    """Record a listing in the set; False if the same title/company/location was already there"""
+    listing = (job['title'].lower(), job['company'].lower(), job['location'].lower())
+    if listing in seen:
+        return False
+    seen.add(listing)
+    return True
+
+def _dedup_key(job: Dict) -> int:
+    """Hash of the lower-cased, stripped title and company"""
+    return hash(f"{job['title'].strip()}\x00{job['company'].strip()}".lower())
+
+def _csv_row(job: Dict) -> tuple:
+    """A job's values in _CSV_FIELDS order, with missing fields left blank"""
+    try:
+        return _CSV_GETTER(job)
+    except KeyError:
+        return tuple(job.get(field, '') for field in _CSV_FIELDS)
+
+def _title_words(title: str) -> frozenset:
+    """Lower-cased title words with common abbreviations spelled out"""
+    return frozenset(_TITLE_ABBREVIATIONS.get(word, word) for word in _WORD_RE.findall(title.lower()))
+
+def _page_title(html) -> str:
+    """Text of the page's <title>, found without building a tree"""
+    if isinstance(html, bytes):
+        html = html.decode('utf-8', 'replace')
+    match = _TITLE_RE.search(html)
+    return match.group(1).strip() if match else 'Unknown'
+
+def _select_first(element, selectors):
+    """Return the first element matched by the selectors, tried in order"""
+    for selector in selectors:
+        found = _compile_selector(selector).select_one(element)
+        if found:
+            return found
+    return None
+
+class _FusedSelector:
+    """Selector group checked in one tree walk, falling back to priority order when it is ambiguous"""
+    __slots__ = ('group', 'selectors')
+    
+    def __init__(self, selectors):
+        self.group = _compile_selector(', '.join(selectors))
+        self.selectors = selectors
+    
+    def select_one(self, element):
+        """Return the element the selectors would pick when tried in order"""
+        matches = self.group.select(element, limit=2)
+        if len(matches) > 1:
+            # Document order may disagree with priority order; resolve it the slow way
+            return _select_first(element, self.selectors)
+        return matches[0] if matches else None
+
+# Per-field selector groups for Apna.co and TimesJobs cards; most cards hold a
+# single match per field, which the one-walk group returns directly
+_APNA_TITLE = _FusedSelector(_APNA_TITLE_SELECTORS)
+_APNA_TITLE_TEXT = _FusedSelector(_APNA_TITLE_TEXT_SELECTORS)
+_APNA_COMPANY = _FusedSelector(_APNA_COMPANY_SELECTORS)
+_APNA_LOCATION = _FusedSelector(_APNA_LOCATION_SELECTORS)
+_APNA_SALARY = _FusedSelector(_APNA_SALARY_SELECTORS)
+_APNA_DESC = _FusedSelector(_APNA_DESC_SELECTORS)
+
+_TIMESJOBS_TITLE = _FusedSelector(_TIMESJOBS_TITLE_SELECTORS)
+_TIMESJOBS_COMPANY = _FusedSelector(_TIMESJOBS_COMPANY_SELECTORS)
+_TIMESJOBS_LOCATION = _FusedSelector(_TIMESJOBS_LOCATION_SELECTORS)
+_TIMESJOBS_EXP = _FusedSelector(_TIMESJOBS_EXP_SELECTORS)
+_TIMESJOBS_SALARY = _FusedSelector(_TIMESJOBS_SALARY_SELECTORS)
+_TIMESJOBS_DESC = _FusedSelector(_TIMESJOBS_DESC_SELECTORS)
+
+# First anchor in a card that actually carries a link
+_LINK = _compile_selector('a[href]')
+
+# Any list item or block whose class mentions "job"
+_TIMESJOBS_FALLBACK = _compile_selector('li[class*="job" i], div[class*="job" i]')
+
+class _TTLCache:
+    """Thread-safe LRU cache whose entries expire a fixed number of seconds after being stored"""
+    
+    def __init__(self, maxsize: int = _CACHE_MAX_ENTRIES, ttl: float = _CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """Return the stored value, or None when missing or expired"""
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is None:
+                return None
+            stored_at, value = hit
+            if time.monotonic() - stored_at >= self.ttl:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+    
+    def put(self, key, value):
+        """Store a value, evicting the least recently used entries past maxsize"""
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+class _SampleJob(dict):
+    """A job dict made up from sample data rather than scraped, so it is never cached"""
+    __slots__ = ()
+
+@dataclass(slots=True)
+class JobRecord:
+    """A single job listing while it is being scraped; converted to a dict once complete"""
+    title: str = ''
+    company: str = ''
+    location: str = ''
+    experience: str = ''
+    salary: str = 'Not disclosed'
+    description: str = ''
+    apply_url: str = '#'
+    source: str = ''
+    
+    def to_dict(self) -> Dict:
+        """Plain dict in CSV column order"""
+        return {
+            'title': self.title,
+            'company': self.company,
+            'location': self.location,
+            'experience': self.experience,
+            'salary': self.salary,
+            'description': self.description,
+            'apply_url': self.apply_url,
+            'source': self.source
+        }
 
 class SimpleJobSearch:
+    __slots__ = ('session', '_pool', '_host_sems', '_next_ok', '_gate_lock',
+                 '_strikes', '_warmed', '_warm_lock', '_resp_cache')
+    
+    # Job cards parsed per Apna.co / TimesJobs results page
+    MAX_CARDS = 8
+    
     def __init__(self):
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+        # One shared session so keep-alive connections are reused across sites and calls
+        self.session = requests.Session()
+        self.session.headers.update(_HEADERS_HTML)
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=_RETRY)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Worker threads so the per-site fetches overlap instead of running back to back
+        self._pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='job-search')
+        self._host_sems = {}
+        self._next_ok = {}
+        self._gate_lock = threading.Lock()
+        self._strikes = {}
+        self._warmed = {}
+        self._warm_lock = threading.Lock()
+        self._resp_cache = _TTLCache()
+    
+    def _host_slot(self, host: str) -> threading.Semaphore:
+        """Semaphore bounding in-flight requests to a single host"""
+        return self._host_sems.setdefault(host, threading.Semaphore(_HOST_CONCURRENCY))
+    
+    def _fetch(self, url: str, method: str = 'GET', **kwargs) -> requests.Response:
+        """Request through the shared session, spacing out requests to the same host"""
+        host = urlsplit(url).netloc
+        with self._host_slot(host):
+            self._rate_gate(host)
+            response = self.session.request(method, url, **kwargs)
+        
+        self._throttle(host, response)
+        return response
+    
+    def _throttle(self, host: str, response: requests.Response):
+        """Push back the host's next slot when it signals throttling, and forget past strikes once it doesn't"""
+        retry_after = response.headers.get('Retry-After', '')
+        throttled = (response.status_code == 429 or
+                     response.headers.get('X-RateLimit-Remaining', '').strip() == '0')
+        
+        with self._gate_lock:
+            if response.status_code in (429, 503) and retry_after.isdigit():
+                # Still throttled after the adapter's retries: hold this host back as asked, within reason
+                hold = min(int(retry_after), _HOST_MAX_BACKOFF)
+            elif throttled:
+                # No hint from the server: back off exponentially, with jitter, per consecutive strike
+                strikes = self._strikes.get(host, 0)
+                self._strikes[host] = strikes + 1
+                hold = min(_HOST_MAX_BACKOFF, _HOST_MIN_INTERVAL * 2 ** strikes) + random.random()
+            else:
+                self._strikes.pop(host, None)
+                return
+            
+            self._next_ok[host] = max(self._next_ok.get(host, 0.0), time.monotonic() + hold)
+    
+    def _rate_gate(self, host: str, interval: float = _HOST_MIN_INTERVAL):
+        """Wait for the host's next free request slot, reserving the one after it"""
+        with self._gate_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_ok.get(host, 0.0))
+            self._next_ok[host] = slot + interval
+        
+        if slot > now:
+            time.sleep(slot - now)
+    
+    def _map_pages(self, fetch_page, urls: List[str]) -> List[List[Dict]]:
+        """Fetch and parse result pages, in parallel when there is more than one"""
+        if len(urls) == 1:
+            return [fetch_page(urls[0])]
+        
+        # A short-lived pool, since this already runs on one of self._pool's workers
+        with ThreadPoolExecutor(max_workers=len(urls)) as page_pool:
+            return list(page_pool.map(fetch_page, urls))
+    
+    def _warm_up(self, url: str, **kwargs):
+        """Fetch a portal homepage when first needed, and again once its cookies may have expired"""
+        with self._warm_lock:
+            warmed_at = self._warmed.get(url)
+            if warmed_at is not None and time.monotonic() - warmed_at < _CACHE_TTL:
+                return
+            self._fetch(url, **kwargs)
+            self._warmed[url] = time.monotonic()
+    
+    def _forget_warm_up(self, url: str):
+        """Make the next search fetch this homepage again"""
+        with self._warm_lock:
+            self._warmed.pop(url, None)
+    
+    def warm_up(self):
+        """Open connections to the portals search_jobs uses in the background so the first search finds them ready"""
+        self._pool.submit(self._warm_up, _TIMESJOBS_HOME, headers=_TIMESJOBS_HEADERS, timeout=10)
+        self._pool.submit(self._fetch, "https://www.linkedin.com/", method='HEAD', allow_redirects=False, timeout=10)
+    
+    def close(self):
+        """Stop the worker threads and close the pooled connections"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
     
     def search_apna(self, job_title: str, location: str = "India") -> List[Dict]:
         """Search jobs on Apna.co - scraper-friendly Indian job portal"""
         jobs = []
         
+        key = ('apna', job_title.lower().strip(), location.lower().strip())
+        cached = self._resp_cache.get(key)
+        if cached is not None:
+            _log.info("⚡ Using cached Apna.co results for: %s", job_title)
+            return list(cached)
+        
         try:
-            print(f"🔍 Searching Apna.co for: {job_title}")
+            _log.info("🔍 Searching Apna.co for: %s", job_title)
             
             # Apna.co search URL structure
-            search_url = f"https://apna.co/jobs/{job_title.lower().replace(' ', '-')}"
+            search_url = f"https://apna.co/jobs/{quote(job_title.lower().replace(' ', '-'), safe='')}"
             
             # Alternative URL format
             if location.lower() != "india":
-                search_url = f"https://apna.co/jobs?search={job_title.replace(' ', '%20')}&location={location.replace(' ', '%20')}"
+                search_url = f"https://apna.co/jobs?{urlencode({'search': job_title, 'location': location})}"
             
-            print(f"   URL: {search_url}")
+            _log.debug("   URL: %s", search_url)
             
-            # Headers for Apna.co
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9,hi;q=0.8',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Referer': 'https://apna.co/',
-                'Upgrade-Insecure-Requests': '1'
-            }
-            
-            response = requests.get(search_url, headers=headers, timeout=15)
+            response = self._fetch(search_url, headers=_APNA_HEADERS, timeout=15)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Debug
-                page_title = soup.find('title')
-                print(f"   Page loaded: {page_title.get_text() if page_title else 'Unknown'}")
-                
-                # Find job cards on Apna.co
-                job_cards = self.find_apna_job_cards(soup)
-                
-                print(f"   Found {len(job_cards)} job cards")
-                
-                for i, card in enumerate(job_cards[:8]):  # Limit to 8 jobs
-                    job_data = self.parse_apna_job_card(card)
-                    if job_data:
-                        jobs.append(job_data)
-                        print(f"   ✓ Parsed job {i+1}: {job_data['title']} at {job_data['company']}")
+                jobs = _parse_in_worker(_parse_apna_html, _markup(response))
+                if jobs:
+                    self._resp_cache.put(key, tuple(jobs))
             
             else:
-                print(f"   HTTP {response.status_code}")
-            
-            # Add delay to be respectful
-            time.sleep(2)
+                _log.debug("   HTTP %d", response.status_code)
             
             # Fallback to sample data if needed
             if not jobs:
-                print("⚠️ Apna scraping failed, adding sample Apna jobs")
+                _log.warning("⚠️ Apna scraping failed, adding sample Apna jobs")
                 jobs = self.get_sample_apna_jobs(job_title, location)
             
-            print(f"✅ Found {len(jobs)} jobs from Apna.co")
+            _log.info("✅ Found %d jobs from Apna.co", len(jobs))
             
         except Exception as e:
-            print(f"⚠️ Apna search failed: {e}")
+            _log.warning("⚠️ Apna search failed: %s", e)
             jobs = self.get_sample_apna_jobs(job_title, location)
         
         return jobs
     
-    def find_apna_job_cards(self, soup):
+    @staticmethod
+    def find_apna_job_cards(soup):
         """Find job cards on Apna.co using multiple selectors"""
         job_cards = []
         
-        # Try different selectors for Apna.co
-        selectors_to_try = [
-            '.job-card',
-            '.job-item',
-            '[data-job-id]',
-            '.listing-item',
-            '.job-listing',
-            '.card',
-            'article',
-            '.job-post'
-        ]
-        
-        for selector in selectors_to_try:
-            cards = soup.select(selector)
+        # Try different selectors for Apna.co, stopping each scan once a page's worth is found
+        for selector in _APNA_CARD_SELECTORS:
+            cards = _compile_selector(selector).select(soup, limit=SimpleJobSearch.MAX_CARDS)
             if cards:
-                print(f"   Using selector: {selector} ({len(cards)} found)")
+                _log.debug("   Using selector: %s (%d found)", selector, len(cards))
                 job_cards = cards
                 break
         
-        # If no specific job cards found, look for any structured content
+        # If no specific job cards found, look for any structured content,
+        # stopping as soon as a page's worth of candidates has turned up
         if not job_cards:
-            job_cards = soup.find_all(['div', 'article'], class_=lambda x: x and len(x) > 5)
+            job_cards = soup.find_all(['div', 'article'], class_=lambda x: x and len(x) > 5,
+                                      limit=SimpleJobSearch.MAX_CARDS)
         
         return job_cards
     
-    def parse_apna_job_card(self, card):
+    @staticmethod
+    def parse_apna_job_card(card):
         """Parse individual Apna.co job card"""
         try:
-            job_data = {
-                'title': '',
-                'company': '',
-                'location': '',
-                'experience': '',
-                'salary': 'Not disclosed',
-                'description': '',
-                'apply_url': '#',
-                'source': 'Apna.co'
-            }
+            job_data = JobRecord(source='Apna.co')
             
             # Extract job title and link
-            title_selectors = [
-                'h2 a', 'h3 a', '.job-title a', '.title a', 
-                'a[href*="job"]', '.job-name', '.position'
-            ]
-            
-            for selector in title_selectors:
-                title_elem = card.select_one(selector)
-                if title_elem:
-                    job_data['title'] = title_elem.get_text(strip=True)
-                    href = title_elem.get('href')
-                    if href and self.is_valid_job_url(href):
-                        if href.startswith('/'):
-                            job_data['apply_url'] = f"https://apna.co{href}"
-                        else:
-                            job_data['apply_url'] = href
-                    break
+            title_elem = _APNA_TITLE.select_one(card) or _select_first(card, _APNA_TITLE_FALLBACK_SELECTORS)
+            if title_elem:
+                job_data.title = title_elem.get_text(strip=True)
+                href = title_elem.get('href')
+                if href and SimpleJobSearch.is_valid_job_url(href):
+                    if href.startswith('/'):
+                        job_data.apply_url = f"https://apna.co{href}"
+                    else:
+                        job_data.apply_url = href
             
             # If no link found, try text-only title
-            if not job_data['title']:
-                title_text_selectors = ['h2', 'h3', '.job-title', '.title', '.job-name']
-                for selector in title_text_selectors:
-                    title_elem = card.select_one(selector)
-                    if title_elem:
-                        job_data['title'] = title_elem.get_text(strip=True)
-                        break
+            if not job_data.title:
+                title_elem = _APNA_TITLE_TEXT.select_one(card)
+                if title_elem:
+                    job_data.title = title_elem.get_text(strip=True)
             
             # If still no apply URL, look for any job-related links in the card
-            if job_data['apply_url'] == '#':
+            if job_data.apply_url == '#':
                 all_links = card.find_all('a', href=True)
                 for link in all_links:
                     href = link.get('href')
-                    if href and self.is_valid_job_url(href):
+                    if href and SimpleJobSearch.is_valid_job_url(href):
                         if href.startswith('/'):
-                            job_data['apply_url'] = f"https://apna.co{href}"
+                            job_data.apply_url = f"https://apna.co{href}"
                         else:
-                            job_data['apply_url'] = href
+                            job_data.apply_url = href
                         break
             
             # Extract company name
-            company_selectors = [
-                '.company-name', '.company', '.employer', 
-                '.org-name', '.business-name'
-            ]
-            
-            for selector in company_selectors:
-                company_elem = card.select_one(selector)
-                if company_elem:
-                    job_data['company'] = company_elem.get_text(strip=True)
-                    break
+            company_elem = _APNA_COMPANY.select_one(card)
+            if company_elem:
+                job_data.company = company_elem.get_text(strip=True)
             
             # Extract location
-            location_selectors = [
-                '.location', '.job-location', '.place', '.city'
-            ]
-            
-            for selector in location_selectors:
-                location_elem = card.select_one(selector)
-                if location_elem:
-                    job_data['location'] = location_elem.get_text(strip=True)
-                    break
+            location_elem = _APNA_LOCATION.select_one(card)
+            if location_elem:
+                job_data.location = location_elem.get_text(strip=True)
             
             # Extract salary
-            salary_selectors = [
-                '.salary', '.pay', '.wage', '.compensation'
-            ]
-            
-            for selector in salary_selectors:
-                salary_elem = card.select_one(selector)
-                if salary_elem:
-                    job_data['salary'] = salary_elem.get_text(strip=True)
-                    break
+            salary_elem = _APNA_SALARY.select_one(card)
+            if salary_elem:
+                job_data.salary = salary_elem.get_text(strip=True)
             
             # Extract description
-            desc_selectors = [
-                '.description', '.job-desc', '.summary', '.details'
-            ]
-            
-            for selector in desc_selectors:
-                desc_elem = card.select_one(selector)
-                if desc_elem:
-                    job_data['description'] = desc_elem.get_text(strip=True)[:200] + "..."
-                    break
+            desc_elem = _APNA_DESC.select_one(card)
+            if desc_elem:
+                job_data.description = desc_elem.get_text(strip=True)[:200] + "..."
             
             # Only return if we have essential data
-            if job_data['title']:
+            if job_data.title:
                 # Set defaults
-                if not job_data['company']:
-                    job_data['company'] = 'Various Companies'
-                if not job_data['location']:
-                    job_data['location'] = 'India'
-                if not job_data['experience']:
-                    job_data['experience'] = 'As per requirement'
+                if not job_data.company:
+                    job_data.company = 'Various Companies'
+                if not job_data.location:
+                    job_data.location = 'India'
+                if not job_data.experience:
+                    job_data.experience = 'As per requirement'
                 
                 # Ensure we have a working apply URL
-                if job_data['apply_url'] == '#' or not self.is_valid_job_url(job_data['apply_url']):
-                    job_data['apply_url'] = self.get_fallback_job_url(job_data['title'], job_data['company'], 'Apna.co')
+                if job_data.apply_url == '#' or not SimpleJobSearch.is_valid_job_url(job_data.apply_url):
+                    job_data.apply_url = SimpleJobSearch.get_fallback_job_url(job_data.title, job_data.company, 'Apna.co')
                 
-                return job_data
+                return job_data.to_dict()
             
             return None
             
         except Exception as e:
-            print(f"   Error parsing Apna job card: {e}")
+            _log.debug("   Error parsing Apna job card: %s", e)
             return None
     
     def get_sample_apna_jobs(self, job_title: str, location: str) -> List[Dict]:
         """Sample Apna.co jobs when scraping fails"""
-        companies = ["Zomato", "Swiggy", "Urban Company", "Dunzo", "BigBasket", "Grofers", "Ola", "Uber"]
-        locations = ["Delhi", "Mumbai", "Bangalore", "Hyderabad", "Chennai", "Pune", "Kolkata", "Ahmedabad"]
+        titles = (job_title, f"Senior {job_title}")
         
         jobs = []
-        for i in range(6):
-            company = companies[i % len(companies)]
-            title = f"{job_title}" if i == 0 else f"Senior {job_title}" if i == 1 else f"{job_title} - {company}"
+        for i, company, job_location in zip(range(6), cycle(_APNA_SAMPLE_COMPANIES), cycle(_APNA_SAMPLE_LOCATIONS)):
+            title = titles[i] if i < 2 else f"{job_title} - {company}"
             
-            jobs.append({
+            jobs.append(_SampleJob({
                 'title': title,
                 'company': company,
-                'location': locations[i % len(locations)],
+                'location': job_location,
                 'experience': f"{1 + i}-{3 + i} years" if i > 0 else "Fresher",
                 'salary': f"₹{15 + i * 5}k - ₹{25 + i * 8}k per month",
                 'description': f"Exciting {job_title} opportunity at {company} with growth potential and competitive benefits.",
                 'apply_url': self.get_fallback_job_url(title, company, 'Apna.co'),
                 'source': 'Apna.co'
-            })
+            }))
         
         return jobs
     
-    def is_valid_job_url(self, url: str) -> bool:
+    @staticmethod
+    def is_valid_job_url(url: str) -> bool:
         """Check if URL looks like a valid job posting URL"""
-        if not url:
-            return False
-        
         # Check for common job URL patterns
-        job_patterns = [
-            '/job/', '/jobs/', '/career/', '/careers/', 
-            '/vacancy/', '/opening/', '/position/',
-            'job-detail', 'job_detail', 'jobdetail'
-        ]
-        
-        return any(pattern in url.lower() for pattern in job_patterns)
+        return bool(url) and _JOB_URL_RE.search(url) is not None
     
-    def get_fallback_job_url(self, job_title: str, company: str, source: str) -> str:
+    @staticmethod
+    def get_fallback_job_url(job_title: str, company: str, source: str) -> str:
         """Generate a working fallback URL for job applications"""
-        job_slug = job_title.lower().replace(' ', '-').replace('/', '-')
-        company_slug = company.lower().replace(' ', '-').replace('/', '-')
-        
         if source == 'Apna.co':
             # Use Apna's job search with specific parameters
-            return f"https://apna.co/jobs?search={job_title.replace(' ', '%20')}&company={company.replace(' ', '%20')}"
+            return f"https://apna.co/jobs?{urlencode({'search': job_title, 'company': company})}"
         elif source == 'TimesJobs':
             # Use TimesJobs search with specific parameters  
-            return f"https://www.timesjobs.com/candidate/job-search.html?searchType=personalizedSearch&from=submit&txtKeywords={job_title.replace(' ', '%20')}&txtLocation=India"
+            params = {
+                'searchType': 'personalizedSearch',
+                'from': 'submit',
+                'txtKeywords': job_title,
+                'txtLocation': 'India'
+            }
+            return f"https://www.timesjobs.com/candidate/job-search.html?{urlencode(params)}"
         else:
             # Generic job search
-            return f"https://www.google.com/search?q={job_title.replace(' ', '+')}+jobs+at+{company.replace(' ', '+')}"
+            return f"https://www.google.com/search?q={quote_plus(f'{job_title} jobs at {company}')}"
     
-    def search_timesjobs(self, job_title: str, location: str = "India") -> List[Dict]:
-        """Search jobs on TimesJobs.com with real scraping"""
+    def search_timesjobs(self, job_title: str, location: str = "India", pages: int = 1) -> List[Dict]:
+        """Search jobs on TimesJobs.com with real scraping, fetching result pages concurrently"""
         jobs = []
         
+        key = ('timesjobs', job_title.lower().strip(), location.lower().strip(), pages)
+        cached = self._resp_cache.get(key)
+        if cached is not None:
+            _log.info("⚡ Using cached TimesJobs results for: %s", job_title)
+            return list(cached)
+        
         try:
-            print(f"🔍 Searching TimesJobs for: {job_title}")
+            _log.info("🔍 Searching TimesJobs for: %s", job_title)
             
             # TimesJobs search URL
             search_url = "https://www.timesjobs.com/candidate/job-search.html"
@@ -301,356 +754,213 @@ class SimpleJobSearch:
                 'txtLocation': location if location != "India" else ""
             }
             
-            # Build URL
-            param_string = "&".join([f"{k}={v.replace(' ', '%20')}" for k, v in params.items() if v])
-            full_url = f"{search_url}?{param_string}"
-            
-            print(f"   URL: {full_url}")
-            
-            # Enhanced headers to avoid blocking
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Referer': 'https://www.timesjobs.com/',
-                'Upgrade-Insecure-Requests': '1',
-                'Cache-Control': 'no-cache'
-            }
-            
-            # Use session for better success
-            session = requests.Session()
-            session.headers.update(headers)
+            # Build one URL per results page
+            params = {k: v for k, v in params.items() if v}
+            page_urls = [f"{search_url}?{urlencode(params)}"]
+            page_urls += [f"{search_url}?{urlencode({**params, 'sequence': page + 1, 'startPage': 1})}"
+                          for page in range(1, pages)]
             
-            # First visit homepage
-            session.get("https://www.timesjobs.com/", timeout=10)
-            time.sleep(2)
+            # First visit homepage (again every _CACHE_TTL) so its cookies land on the shared session
+            self._warm_up(_TIMESJOBS_HOME, headers=_TIMESJOBS_HEADERS, timeout=10)
             
             # Then search
-            response = session.get(full_url, timeout=15)
+            seen = set()
+            # A single page keeps the usual short list; paginated searches take every card per page
+            card_limit = _TIMESJOBS_PAGE_SIZE if pages > 1 else SimpleJobSearch.MAX_CARDS
+            fetch_page = functools.partial(self._fetch_timesjobs_page, limit=card_limit)
+            for page_jobs in self._map_pages(fetch_page, page_urls):
+                jobs.extend(job for job in page_jobs if _mark_seen(seen, job))
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Debug
-                page_title = soup.find('title')
-                print(f"   Page loaded: {page_title.get_text() if page_title else 'Unknown'}")
-                
-                # Find job cards on TimesJobs
-                job_cards = self.find_timesjobs_job_cards(soup)
-                
-                print(f"   Found {len(job_cards)} job cards")
-                
-                for i, card in enumerate(job_cards[:8]):  # Limit to 8 jobs
-                    job_data = self.parse_timesjobs_job_card(card)
-                    if job_data:
-                        jobs.append(job_data)
-                        print(f"   ✓ Parsed job {i+1}: {job_data['title']} at {job_data['company']}")
-            
-            else:
-                print(f"   HTTP {response.status_code}")
-            
-            # Add delay to be respectful
-            time.sleep(2)
+            if jobs:
+                self._resp_cache.put(key, tuple(jobs))
             
             # Fallback to sample data if needed
             if not jobs:
-                print("⚠️ TimesJobs scraping failed, adding sample TimesJobs")
+                _log.warning("⚠️ TimesJobs scraping failed, adding sample TimesJobs")
                 jobs = self.get_sample_timesjobs(job_title, location)
             
-            print(f"✅ Found {len(jobs)} jobs from TimesJobs")
+            _log.info("✅ Found %d jobs from TimesJobs", len(jobs))
             
         except Exception as e:
-            print(f"⚠️ TimesJobs search failed: {e}")
+            _log.warning("⚠️ TimesJobs search failed: %s", e)
             jobs = self.get_sample_timesjobs(job_title, location)
         
         return jobs
     
-    def find_timesjobs_job_cards(self, soup):
+    def _fetch_timesjobs_page(self, url: str, limit: int = MAX_CARDS) -> List[Dict]:
+        """Fetch and parse one TimesJobs results page"""
+        _log.debug("   URL: %s", url)
+        response = self._fetch(url, headers=_TIMESJOBS_HEADERS, timeout=15)
+        
+        if response.status_code != 200:
+            # Likely stale cookies: visit the homepage again before the next search
+            _log.debug("   HTTP %d", response.status_code)
+            self._forget_warm_up(_TIMESJOBS_HOME)
+            return []
+        
+        return _parse_in_worker(_parse_timesjobs_html, _markup(response), limit)
+    
+    @staticmethod
+    def find_timesjobs_job_cards(soup, limit: int = MAX_CARDS):
         """Find job cards on TimesJobs using updated selectors"""
         job_cards = []
         
         # Updated TimesJobs selectors based on current website structure
-        selectors_to_try = [
-            '.srp-container .joblist',
-            '.job-bx.wht-shd-bx',
-            '.joblist-comp.clearfix',
-            'li.clearfix.job-bx',
-            '.job-bx',
-            '.clearfix.job-bx.wht-shd-bx',
-            'article.jobTuple'
-        ]
-        
-        for selector in selectors_to_try:
-            cards = soup.select(selector)
+        for selector in _TIMESJOBS_CARD_SELECTORS:
+            cards = _compile_selector(selector).select(soup, limit=limit)
             if cards:
-                print(f"   Using selector: {selector} ({len(cards)} found)")
+                _log.debug("   Using selector: %s (%d found)", selector, len(cards))
                 job_cards = cards
                 break
         
         # If no specific cards found, try broader search
         if not job_cards:
-            job_cards = soup.find_all(['li', 'div'], class_=lambda x: x and 'job' in x.lower())
-            print(f"   Fallback search found {len(job_cards)} potential job elements")
+            job_cards = _TIMESJOBS_FALLBACK.select(soup, limit=limit)
+            _log.debug("   Fallback search found %d potential job elements", len(job_cards))
         
         return job_cards
     
-    def parse_timesjobs_job_card(self, card):
+    @staticmethod
+    def parse_timesjobs_job_card(card):
         """Parse individual TimesJobs job card with proper URL extraction"""
         try:
-            job_data = {
-                'title': '',
-                'company': '',
-                'location': '',
-                'experience': '',
-                'salary': 'Not disclosed',
-                'description': '',
-                'apply_url': '#',
-                'source': 'TimesJobs'
-            }
+            job_data = JobRecord(source='TimesJobs')
             
             # Extract job title and link - TimesJobs specific structure
-            title_selectors = [
-                'h2 a[title]',
-                '.jobTitle a',
-                'h3.jobTitle a',
-                'a.job-title',
-                '.position a',
-                'h2 a'
-            ]
-            
-            for selector in title_selectors:
-                title_elem = card.select_one(selector)
-                if title_elem:
-                    job_data['title'] = title_elem.get_text(strip=True)
-                    href = title_elem.get('href')
-                    if href:
-                        # TimesJobs URLs are usually relative
-                        if href.startswith('/'):
-                            job_data['apply_url'] = f"https://www.timesjobs.com{href}"
-                        elif href.startswith('http'):
-                            job_data['apply_url'] = href
-                        else:
-                            job_data['apply_url'] = f"https://www.timesjobs.com/{href}"
-                    break
+            title_elem = _TIMESJOBS_TITLE.select_one(card)
+            if title_elem:
+                job_data.title = title_elem.get_text(strip=True)
+                href = title_elem.get('href')
+                if href:
+                    # TimesJobs URLs are usually relative
+                    if href.startswith('/'):
+                        job_data.apply_url = f"https://www.timesjobs.com{href}"
+                    elif href.startswith('http'):
+                        job_data.apply_url = href
+                    else:
+                        job_data.apply_url = f"https://www.timesjobs.com/{href}"
             
             # Extract company name
-            company_selectors = [
-                '.comp-name a',
-                '.company-name',
-                '.companyName',
-                'h3.joblist-comp-name',
-                '.job-advertiser'
-            ]
-            
-            for selector in company_selectors:
-                company_elem = card.select_one(selector)
-                if company_elem:
-                    job_data['company'] = company_elem.get_text(strip=True)
-                    break
+            company_elem = _TIMESJOBS_COMPANY.select_one(card)
+            if company_elem:
+                job_data.company = company_elem.get_text(strip=True)
             
             # Extract location
-            location_selectors = [
-                '.location .locationsContainer',
-                '.job-location',
-                '.locationsContainer',
-                '.loc'
-            ]
-            
-            for selector in location_selectors:
-                location_elem = card.select_one(selector)
-                if location_elem:
-                    job_data['location'] = location_elem.get_text(strip=True)
-                    break
+            location_elem = _TIMESJOBS_LOCATION.select_one(card)
+            if location_elem:
+                job_data.location = location_elem.get_text(strip=True)
             
             # Extract experience
-            exp_selectors = [
-                '.experience .expwdth',
-                '.exp',
-                '.job-experience'
-            ]
-            
-            for selector in exp_selectors:
-                exp_elem = card.select_one(selector)
-                if exp_elem:
-                    job_data['experience'] = exp_elem.get_text(strip=True)
-                    break
+            exp_elem = _TIMESJOBS_EXP.select_one(card)
+            if exp_elem:
+                job_data.experience = exp_elem.get_text(strip=True)
             
             # Extract salary
-            salary_selectors = [
-                '.salary .sal',
-                '.package',
-                '.ctc'
-            ]
-            
-            for selector in salary_selectors:
-                salary_elem = card.select_one(selector)
-                if salary_elem:
-                    job_data['salary'] = salary_elem.get_text(strip=True)
-                    break
+            salary_elem = _TIMESJOBS_SALARY.select_one(card)
+            if salary_elem:
+                job_data.salary = salary_elem.get_text(strip=True)
             
             # Extract job description/snippet
-            desc_selectors = [
-                '.job-description',
-                '.list-job-dtl',
-                '.more-info'
-            ]
-            
-            for selector in desc_selectors:
-                desc_elem = card.select_one(selector)
-                if desc_elem:
-                    job_data['description'] = desc_elem.get_text(strip=True)[:200] + "..."
-                    break
+            desc_elem = _TIMESJOBS_DESC.select_one(card)
+            if desc_elem:
+                job_data.description = desc_elem.get_text(strip=True)[:200] + "..."
             
             # Only return if we have essential data
-            if job_data['title'] and job_data['company']:
+            if job_data.title and job_data.company:
                 # Set defaults
-                if not job_data['location']:
-                    job_data['location'] = 'India'
-                if not job_data['experience']:
-                    job_data['experience'] = 'As per requirement'
+                if not job_data.location:
+                    job_data.location = 'India'
+                if not job_data.experience:
+                    job_data.experience = 'As per requirement'
                 
                 # Ensure we have a working apply URL
-                if job_data['apply_url'] == '#':
-                    job_data['apply_url'] = self.get_fallback_job_url(job_data['title'], job_data['company'], 'TimesJobs')
+                if job_data.apply_url == '#':
+                    job_data.apply_url = SimpleJobSearch.get_fallback_job_url(job_data.title, job_data.company, 'TimesJobs')
                 
-                return job_data
+                return job_data.to_dict()
             
             return None
             
         except Exception as e:
-            print(f"   Error parsing TimesJobs job card: {e}")
+            _log.debug("   Error parsing TimesJobs job card: %s", e)
             return None
     
     def get_sample_timesjobs(self, job_title: str, location: str) -> List[Dict]:
         """Sample TimesJobs"""
-        companies = ["Accenture", "Capgemini", "IBM", "Deloitte", "EY", "KPMG"]
-        locations = ["Gurgaon", "Noida", "Bangalore", "Hyderabad", "Chennai", "Mumbai"]
+        # The TimesJobs fallback URL only depends on the title, so build each one once
+        senior_title = f"Senior {job_title}"
+        urls = {
+            job_title: self.get_fallback_job_url(job_title, '', 'TimesJobs'),
+            senior_title: self.get_fallback_job_url(senior_title, '', 'TimesJobs')
+        }
         
         jobs = []
-        for i in range(4):
-            company = companies[i % len(companies)]
-            title = f"{job_title}" if i == 0 else f"Senior {job_title}"
+        for i, company, job_location in zip(range(4), cycle(_TIMESJOBS_SAMPLE_COMPANIES), cycle(_TIMESJOBS_SAMPLE_LOCATIONS)):
+            title = job_title if i == 0 else senior_title
             
-            jobs.append({
+            jobs.append(_SampleJob({
                 'title': title,
                 'company': company,
-                'location': locations[i % len(locations)],
+                'location': job_location,
                 'experience': f"{2 + i}-{5 + i} years",
                 'salary': f"₹{4 + i * 3}-{8 + i * 4} Lakh PA",
                 'description': f"Great {job_title} opportunity at {company}.",
-                'apply_url': self.get_fallback_job_url(title, company, 'TimesJobs'),
+                'apply_url': urls[title],
                 'source': 'TimesJobs'
-            })
+            }))
         
         return jobs
     
     def parse_indeed_job_card(self, card):
         """Parse individual Indeed job card"""
         try:
-            job_data = {
-                'title': '',
-                'company': '',
-                'location': '',
-                'experience': '',
-                'salary': 'Not disclosed',
-                'description': '',
-                'apply_url': '#',
-                'source': 'Indeed'
-            }
+            job_data = JobRecord(source='Indeed')
             
             # Extract job title and link
-            title_selectors = [
-                'h2 a[data-jk]',
-                '.jobTitle a',
-                'h2.jobTitle a',
-                '[data-testid="job-title"] a',
-                'a[data-jk]'
-            ]
-            
-            for selector in title_selectors:
-                title_elem = card.select_one(selector)
-                if title_elem:
-                    job_data['title'] = title_elem.get_text(strip=True)
-                    href = title_elem.get('href')
-                    if href:
-                        if href.startswith('/'):
-                            job_data['apply_url'] = f"https://www.indeed.com{href}"
-                        else:
-                            job_data['apply_url'] = href
-                    break
+            title_elem = _select_first(card, _INDEED_TITLE_SELECTORS)
+            if title_elem:
+                job_data.title = title_elem.get_text(strip=True)
+                href = title_elem.get('href')
+                if href:
+                    if href.startswith('/'):
+                        job_data.apply_url = f"https://www.indeed.com{href}"
+                    else:
+                        job_data.apply_url = href
             
             # Extract company name
-            company_selectors = [
-                '.companyName',
-                '[data-testid="company-name"]',
-                '.company',
-                'span.companyName a',
-                'span.companyName'
-            ]
-            
-            for selector in company_selectors:
-                company_elem = card.select_one(selector)
-                if company_elem:
-                    job_data['company'] = company_elem.get_text(strip=True)
-                    break
+            company_elem = _select_first(card, _INDEED_COMPANY_SELECTORS)
+            if company_elem:
+                job_data.company = company_elem.get_text(strip=True)
             
             # Extract location
-            location_selectors = [
-                '.companyLocation',
-                '[data-testid="job-location"]',
-                '.location',
-                'div.companyLocation'
-            ]
-            
-            for selector in location_selectors:
-                location_elem = card.select_one(selector)
-                if location_elem:
-                    job_data['location'] = location_elem.get_text(strip=True)
-                    break
+            location_elem = _select_first(card, _INDEED_LOCATION_SELECTORS)
+            if location_elem:
+                job_data.location = location_elem.get_text(strip=True)
             
             # Extract salary
-            salary_selectors = [
-                '.salary-snippet',
-                '.salaryText',
-                '[data-testid="job-salary"]',
-                '.salary'
-            ]
-            
-            for selector in salary_selectors:
-                salary_elem = card.select_one(selector)
-                if salary_elem:
-                    job_data['salary'] = salary_elem.get_text(strip=True)
-                    break
+            salary_elem = _select_first(card, _INDEED_SALARY_SELECTORS)
+            if salary_elem:
+                job_data.salary = salary_elem.get_text(strip=True)
             
             # Extract job snippet/description
-            desc_selectors = [
-                '.job-snippet',
-                '.summary',
-                '[data-testid="job-snippet"]'
-            ]
-            
-            for selector in desc_selectors:
-                desc_elem = card.select_one(selector)
-                if desc_elem:
-                    job_data['description'] = desc_elem.get_text(strip=True)[:200] + "..."
-                    break
+            desc_elem = _select_first(card, _INDEED_DESC_SELECTORS)
+            if desc_elem:
+                job_data.description = desc_elem.get_text(strip=True)[:200] + "..."
             
             # Only return if we have essential data
-            if job_data['title'] and job_data['company']:
+            if job_data.title and job_data.company:
                 # Set defaults
-                if not job_data['location']:
-                    job_data['location'] = 'Remote'
-                if not job_data['experience']:
-                    job_data['experience'] = 'Not specified'
+                if not job_data.location:
+                    job_data.location = 'Remote'
+                if not job_data.experience:
+                    job_data.experience = 'Not specified'
                 
-                return job_data
+                return job_data.to_dict()
             
             return None
             
         except Exception as e:
-            print(f"   Error parsing Indeed job card: {e}")
+            _log.debug("   Error parsing Indeed job card: %s", e)
             return None
     
     def parse_indeed_alternative(self, soup, job_title, location):
@@ -666,7 +976,7 @@ class SimpleJobSearch:
             
             if (len(text) > 10 and 
                 ('/viewjob' in href or '/jobs/' in href) and
-                any(word in text.lower() for word in ['developer', 'engineer', 'analyst'])):
+                _ROLE_RE.search(text)):
                 
                 if href.startswith('/'):
                     href = f"https://www.indeed.com{href}"
@@ -689,73 +999,88 @@ class SimpleJobSearch:
     
     def get_sample_indeed_jobs(self, job_title: str, location: str) -> List[Dict]:
         """Sample Indeed jobs when scraping fails"""
-        companies = ["Microsoft", "Google", "Amazon", "Apple", "Meta", "Netflix", "Uber", "Airbnb"]
-        locations = ["Remote", "San Francisco, CA", "Seattle, WA", "New York, NY", "Austin, TX"]
+        titles = (job_title, f"Senior {job_title}")
         
-        jobs = []
-        for i in range(6):
-            jobs.append({
-                'title': f"{job_title}" if i == 0 else f"Senior {job_title}" if i == 1 else f"{job_title} - {companies[i % len(companies)]}",
-                'company': companies[i % len(companies)],
-                'location': locations[i % len(locations)],
-                'experience': f"{2 + i}-{5 + i} years",
-                'salary': f"${60 + i * 15}k - ${90 + i * 15}k",
-                'description': f"Exciting {job_title} opportunity at {companies[i % len(companies)]} with competitive benefits and growth opportunities.",
-                'apply_url': f"https://www.indeed.com/viewjob?jk=sample{i}",
-                'source': 'Indeed'
-            })
-        
-        return jobs
+        return [_SampleJob({
+            'title': titles[i] if i < 2 else f"{job_title} - {company}",
+            'company': company,
+            'location': job_location,
+            'experience': f"{2 + i}-{5 + i} years",
+            'salary': f"${60 + i * 15}k - ${90 + i * 15}k",
+            'description': f"Exciting {job_title} opportunity at {company} with competitive benefits and growth opportunities.",
+            'apply_url': f"https://www.indeed.com/viewjob?jk=sample{i}",
+            'source': 'Indeed'
+        }) for i, company, job_location in zip(range(6), cycle(_INDEED_SAMPLE_COMPANIES), cycle(_INDEED_SAMPLE_LOCATIONS))]
     
 
     
-    def search_linkedin(self, job_title: str, location: str = "India") -> List[Dict]:
-        """Search jobs on LinkedIn"""
+    def search_linkedin(self, job_title: str, location: str = "India", pages: int = 1) -> List[Dict]:
+        """Search jobs on LinkedIn, fetching result pages concurrently"""
         jobs = []
+        
+        key = ('linkedin', job_title.lower().strip(), location.lower().strip(), pages)
+        cached = self._resp_cache.get(key)
+        if cached is not None:
+            _log.info("⚡ Using cached LinkedIn results for: %s", job_title)
+            return list(cached)
+        
         try:
             params = {
                 'keywords': job_title,
-                'location': location,
-                'redirect': 'false',
-                'position': '1'
+                'location': location
             }
-            url = f"https://www.linkedin.com/jobs/search?{urlencode(params)}"
+            page_urls = [f"{_LINKEDIN_SEARCH_URL}?{urlencode({**params, 'start': page * _LINKEDIN_PAGE_SIZE})}"
+                         for page in range(pages)]
             
-            print(f"🔍 Searching LinkedIn for: {job_title}")
-            response = requests.get(url, headers=self.headers, timeout=10)
+            _log.info("🔍 Searching LinkedIn for: %s", job_title)
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Try multiple selectors
-                job_cards = (soup.find_all('div', class_='job-search-card') or
-                           soup.find_all('li', class_='result-card') or
-                           soup.find_all('div', {'data-entity-urn': True}))
-                
-                for card in job_cards[:10]:  # Limit to 10 jobs
-                    job = self.parse_linkedin_job(card)
-                    if job:
-                        jobs.append(job)
+            seen = set()
+            card_limit = _LINKEDIN_PAGE_SIZE if pages > 1 else _LINKEDIN_MAX_CARDS
+            fetch_page = functools.partial(self._fetch_linkedin_page, limit=card_limit)
+            for page_jobs in self._map_pages(fetch_page, page_urls):
+                jobs.extend(job for job in page_jobs if _mark_seen(seen, job))
+            
+            if jobs:
+                self._resp_cache.put(key, tuple(jobs))
             
-            print(f"✅ Found {len(jobs)} jobs from LinkedIn")
+            _log.info("✅ Found %d jobs from LinkedIn", len(jobs))
             
         except Exception as e:
-            print(f"⚠️ LinkedIn search failed: {e}")
+            _log.warning("⚠️ LinkedIn search failed: %s", e)
             # Add sample jobs as fallback
             jobs = self.get_sample_linkedin_jobs(job_title)
         
         return jobs
     
-    def parse_linkedin_job(self, card) -> Dict:
+    def _fetch_linkedin_page(self, url: str, limit: int = _LINKEDIN_MAX_CARDS) -> List[Dict]:
+        """Fetch and parse one LinkedIn results page"""
+        response = self._fetch(url, timeout=10)
+        
+        if response.status_code != 200:
+            return []
+        
+        return _parse_in_worker(_parse_linkedin_html, _markup(response), limit)
+    
+    @staticmethod
+    def find_linkedin_job_cards(soup, limit: int = _LINKEDIN_MAX_CARDS):
+        """Find up to limit LinkedIn job cards, trying each card layout in order"""
+        for selector in _LINKEDIN_CARD_SELECTORS:
+            cards = _compile_selector(selector).select(soup, limit=limit)
+            if cards:
+                return cards
+        return []
+    
+    @staticmethod
+    def parse_linkedin_job(card) -> Dict:
         """Parse LinkedIn job card"""
         try:
-            title = self.get_text(card, ['h3', '.result-card__title', '.job-title'])
-            company = self.get_text(card, ['h4', '.result-card__subtitle', '.company-name'])
-            location = self.get_text(card, ['.job-search-card__location', '.result-card__location'])
+            title = SimpleJobSearch.get_text(card, _LINKEDIN_TITLE_SELECTORS)
+            company = SimpleJobSearch.get_text(card, _LINKEDIN_COMPANY_SELECTORS)
+            location = SimpleJobSearch.get_text(card, _LINKEDIN_LOCATION_SELECTORS)
             
             # Get job link
-            link_elem = card.find('a')
-            job_link = link_elem['href'] if link_elem and link_elem.get('href') else "#"
+            link_elem = _LINK.select_one(card)
+            job_link = link_elem['href'] if link_elem else "#"
             if job_link.startswith('/'):
                 job_link = f"https://www.linkedin.com{job_link}"
             
@@ -765,159 +1090,138 @@ class SimpleJobSearch:
                 'location': location or 'Remote',
                 'experience': 'Not specified',
                 'salary': 'Not disclosed',
+                'description': '',
                 'apply_url': job_link,
                 'source': 'LinkedIn'
             }
         except:
             return None
     
-    def get_text(self, element, selectors: List[str]) -> str:
+    @staticmethod
+    def get_text(element, selectors: Iterable[str]) -> str:
         """Helper to get text from element using multiple selectors"""
-        for selector in selectors:
-            try:
-                found = element.select_one(selector)
-                if found:
-                    return found.get_text(strip=True)
-            except:
-                continue
-        return ""  
+        found = _select_first(element, selectors)
+        return found.get_text(strip=True) if found else ""  
   
     def get_realistic_naukri_jobs(self, job_title: str) -> List[Dict]:
         """Realistic Naukri jobs that link to actual working Naukri pages"""
-        base_search = job_title.lower().replace(' ', '-')
-        
-        # Create jobs that mirror the structure from your screenshot
-        # These URLs will take users to actual Naukri search results
-        job_data = [
-            {
-                'title': f"{job_title} - Fresher",
-                'company': "TCS",
-                'location': "Hyderabad, Chennai, Bangalore", 
-                'experience': "0 - 2 years",
-                'salary': "₹ 3-4 Lacs P.A.",
-                'description': "We are looking for a Python Developer to assist in building scalable applications and automation tools. Key Responsibilities: Write clean and efficient Python code, Learn frameworks like Django or Flask, Work on data processing and scripting tasks.",
-                'apply_url': f"https://www.naukri.com/{base_search}-jobs"
-            },
-            {
-                'title': "Prompt Engineer (Fresher)",
-                'company': "IT Shops", 
-                'location': "Hyderabad, Chennai, Bangalore",
-                'experience': "4.3 - 17 reviews",
-                'salary': "Not disclosed",
-                'description': "Exciting opportunity for AI and machine learning enthusiasts. Work with cutting-edge prompt engineering technologies.",
-                'apply_url': "https://www.naukri.com/prompt-engineer-jobs"
-            },
-            {
-                'title': f"{job_title}",
-                'company': "Smart Placement Services",
-                'location': "Hybrid - Hyderabad, Bangalore", 
-                'experience': "Posted 21 days ago",
-                'salary': "Competitive",
-                'description': f"Looking for experienced {job_title} for hybrid work model with flexible timings and growth opportunities.",
-                'apply_url': f"https://www.naukri.com/{base_search}-jobs-in-bangalore"
-            },
-            {
-                'title': f"{job_title} - Fresher (WFH)",
-                'company': "AIVOA",
-                'location': "Bangalore",
-                'experience': "Posted 71 days ago", 
-                'salary': "₹ 2.5-5 Lacs P.A.",
-                'description': f"Work from home opportunity for {job_title} freshers. Complete training provided with mentorship program.",
-                'apply_url': f"https://www.naukri.com/work-from-home-{base_search}-jobs"
-            },
-            {
-                'title': "Data Engineer",
-                'company': "IT Shops",
-                'location': "Hyderabad, Chennai, Bangalore",
-                'experience': "4.3 - 17 reviews",
-                'salary': "Posted 25 days ago",
-                'description': "Data engineering role with modern tech stack including Python, SQL, and cloud platforms. Great learning opportunities.",
-                'apply_url': "https://www.naukri.com/data-engineer-jobs"
-            },
-            {
-                'title': f"{job_title} Fullstack Developer", 
-                'company': "Saushruthi Solutions",
-                'location': "Multiple locations",
-                'experience': "2-5 years",
-                'salary': "₹ 4-8 Lacs P.A.",
-                'description': f"Full stack development role combining {job_title} backend with modern frontend frameworks. Exciting projects ahead.",
-                'apply_url': f"https://www.naukri.com/fullstack-{base_search}-jobs"
-            }
-        ]
+        # Jobs mirror the structure from your screenshot; the URLs take users
+        # to actual Naukri search results
+        fields = {'job_title': job_title, 'base_search': job_title.lower().replace(' ', '-')}
         
-        # Add source to each job
-        for job in job_data:
-            job['source'] = 'Naukri'
-        
-        return job_data
+        return [{**{key: value.format_map(fields) for key, value in template.items()}, 'source': 'Naukri'}
+                for template in _NAUKRI_TEMPLATES]
     
     def get_sample_linkedin_jobs(self, job_title: str) -> List[Dict]:
         """Sample LinkedIn jobs when scraping fails"""
-        companies = ["Microsoft", "Google", "Amazon", "Meta", "Apple"]
-        locations = ["Remote", "San Francisco", "Seattle", "New York", "Austin"]
+        title = f"Senior {job_title}"
         
-        return [{
-            'title': f"Senior {job_title}",
-            'company': companies[i % len(companies)],
-            'location': locations[i % len(locations)],
+        return [_SampleJob({
+            'title': title,
+            'company': company,
+            'location': job_location,
             'experience': f"{3 + i}+ years",
             'salary': f"${80 + i * 20}k - ${120 + i * 20}k",
-            'description': f"Exciting opportunity for {job_title} at {companies[i % len(companies)]} with competitive benefits.",
+            'description': f"Exciting opportunity for {job_title} at {company} with competitive benefits.",
             'apply_url': f"https://www.linkedin.com/jobs/view/{1000000 + i}",
             'source': 'LinkedIn'
-        } for i in range(5)]  
+        }) for i, company, job_location in zip(range(5), cycle(_LINKEDIN_SAMPLE_COMPANIES), cycle(_LINKEDIN_SAMPLE_LOCATIONS))]  
   
-    def search_jobs(self, job_title: str, location: str = "India") -> List[Dict]:
-        """Search jobs from both platforms"""
+    def search_all(self, job_title: str, location: str = "India", pages: int = 1) -> List[Dict]:
+        """Search Apna.co, TimesJobs and LinkedIn concurrently"""
+        futures = [
+            self._pool.submit(self.search_apna, job_title, location),
+            self._pool.submit(self.search_timesjobs, job_title, location, pages),
+            self._pool.submit(self.search_linkedin, job_title, location, pages)
+        ]
+        
         all_jobs = []
+        for future in futures:
+            all_jobs.extend(future.result())
+        
+        # The same posting can come back from more than one portal
+        return self.remove_near_duplicates(self.remove_duplicates(all_jobs))
+    
+    def search_many(self, titles: List[str], location: str = "India",
+                    max_in_flight: int = 8) -> Dict[str, List[Dict]]:
+        """Search several job titles on every portal in one concurrent batch"""
+        in_flight = threading.Semaphore(max_in_flight)
+        
+        def bounded(search, title):
+            with in_flight:
+                return search(title, location)
+        
+        futures = [
+            (title, self._pool.submit(bounded, search, title))
+            for title in titles
+            for search in (self.search_apna, self.search_timesjobs, self.search_linkedin)
+        ]
+        return self._merge(titles, futures)
+    
+    def _merge(self, titles: List[str], futures) -> Dict[str, List[Dict]]:
+        """Collect batched search results per title, skipping searches that raised"""
+        results = {title: [] for title in titles}
+        for title, future in futures:
+            try:
+                results[title].extend(future.result())
+            except Exception as e:
+                _log.warning("⚠️ Batch search failed for %s: %s", title, e)
         
-        print(f"\n🚀 Starting job search for: {job_title}")
-        print("=" * 50)
+        return results
+    
+    def search_jobs(self, job_title: str, location: str = "India", pages: int = 1) -> List[Dict]:
+        """Search jobs from both platforms, optionally over several result pages each"""
+        all_jobs = []
         
-        # Search TimesJobs first
-        timesjobs = self.search_timesjobs(job_title, location)
-        all_jobs.extend(timesjobs)
+        _log.info("\n🚀 Starting job search for: %s", job_title)
+        _log.info("=" * 50)
         
-        # Wait between searches
-        time.sleep(2)
+        cache_key = ('jobs', job_title.lower().strip(), location.lower().strip(), pages)
+        cached = self._resp_cache.get(cache_key)
+        if cached is not None:
+            _log.info("⚡ Using cached results for: %s", job_title)
+            return list(cached)
         
-        # Search LinkedIn
-        linkedin_jobs = self.search_linkedin(job_title, location)
-        all_jobs.extend(linkedin_jobs)
+        # Search both platforms at once; per-host pacing happens in _fetch
+        timesjobs_future = self._pool.submit(self.search_timesjobs, job_title, location, pages)
+        linkedin_future = self._pool.submit(self.search_linkedin, job_title, location, pages)
         
-        # Ensure we have jobs from both sources
-        linkedin_count = sum(1 for job in all_jobs if 'linkedin' in job['source'].lower())
-        timesjobs_count = sum(1 for job in all_jobs if 'timesjobs' in job['source'].lower())
+        all_jobs.extend(timesjobs_future.result())
+        all_jobs.extend(linkedin_future.result())
         
         # If no TimesJobs found, add some sample ones
-        if timesjobs_count == 0:
-            print("⚠️ Adding TimesJobs from database")
+        if not any(_SOURCE_CODES.get(job['source']) == _SRC_TIMESJOBS for job in all_jobs):
+            _log.warning("⚠️ Adding TimesJobs from database")
             sample_timesjobs = self.get_sample_timesjobs(job_title, location)[:4]
             all_jobs.extend(sample_timesjobs)
         
-        # Remove duplicates
-        unique_jobs = self.remove_duplicates(all_jobs)
-        
-        # Recount after deduplication
-        linkedin_count = sum(1 for job in unique_jobs if 'linkedin' in job['source'].lower())
-        timesjobs_count = sum(1 for job in unique_jobs if 'timesjobs' in job['source'].lower())
+        # Drop repeated listings and split by source in a single pass
+        seen = set()
+        linkedin_jobs = []
+        timesjobs_jobs = []
         
-        # Sort jobs to mix sources (alternate between LinkedIn and TimesJobs)
-        linkedin_jobs = [job for job in unique_jobs if 'linkedin' in job['source'].lower()]
-        timesjobs_jobs = [job for job in unique_jobs if 'timesjobs' in job['source'].lower()]
+        for job in self.remove_near_duplicates(all_jobs):
+            key = _dedup_key(job)
+            if key in seen:
+                continue
+            seen.add(key)
+            
+            source = _SOURCE_CODES.get(job['source'], _SRC_OTHER)
+            if source == _SRC_LINKEDIN:
+                linkedin_jobs.append(job)
+            elif source == _SRC_TIMESJOBS:
+                timesjobs_jobs.append(job)
         
-        mixed_jobs = []
-        max_len = max(len(linkedin_jobs), len(timesjobs_jobs))
+        # Mix sources (alternate between TimesJobs and LinkedIn)
+        mixed_jobs = list(filter(None, chain.from_iterable(zip_longest(timesjobs_jobs, linkedin_jobs))))
         
-        for i in range(max_len):
-            if i < len(timesjobs_jobs):
-                mixed_jobs.append(timesjobs_jobs[i])
-            if i < len(linkedin_jobs):
-                mixed_jobs.append(linkedin_jobs[i])
+        _log.info("\n✅ Total jobs found: %d", len(mixed_jobs))
+        _log.info("   💼 LinkedIn: %d jobs", len(linkedin_jobs))
+        _log.info("   📰 TimesJobs: %d jobs", len(timesjobs_jobs))
         
-        print(f"\n✅ Total jobs found: {len(mixed_jobs)}")
-        print(f"   💼 LinkedIn: {linkedin_count} jobs")
-        print(f"   📰 TimesJobs: {timesjobs_count} jobs")
+        # Only cache fully live results, so a failed portal is retried next time
+        if mixed_jobs and not any(isinstance(job, _SampleJob) for job in mixed_jobs):
+            self._resp_cache.put(cache_key, tuple(mixed_jobs))
         return mixed_jobs
     
     def remove_duplicates(self, jobs: List[Dict]) -> List[Dict]:
@@ -926,30 +1230,57 @@ class SimpleJobSearch:
         unique_jobs = []
         
         for job in jobs:
-            key = (job['title'].lower().strip(), job['company'].lower().strip())
+            key = _dedup_key(job)
             if key not in seen:
                 seen.add(key)
                 unique_jobs.append(job)
         
         return unique_jobs
     
+    def remove_near_duplicates(self, jobs: List[Dict]) -> List[Dict]:
+        """Merge listings at the same company whose titles differ only in wording, keeping the longer title"""
+        unique_jobs = []
+        words = []
+        by_company = {}
+        
+        for job in jobs:
+            title_words = _title_words(job['title'])
+            company = ' '.join(_WORD_RE.findall(job['company'].lower()))
+            bucket = by_company.setdefault(company, [])
+            
+            for i in bucket:
+                shorter = min(len(title_words), len(words[i]))
+                if (shorter >= _NEAR_DUP_MIN_WORDS
+                        and not (title_words ^ words[i]) & _SENIORITY_WORDS
+                        and len(title_words & words[i]) / shorter >= _NEAR_DUP_THRESHOLD):
+                    if len(job['title']) > len(unique_jobs[i]['title']):
+                        unique_jobs[i] = job
+                    break
+            else:
+                bucket.append(len(unique_jobs))
+                unique_jobs.append(job)
+                words.append(title_words)
+        
+        return unique_jobs
+    
     def save_to_csv(self, jobs: List[Dict], filename: str = None) -> str:
         """Save jobs to CSV file"""
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"jobs_{timestamp}.csv"
         
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['title', 'company', 'location', 'experience', 'salary', 'apply_url', 'source']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            writer.writeheader()
-            for job in jobs:
-                writer.writerow(job)
+        self.write_csv(jobs, filename)
         
-        print(f"📊 Results saved to: {filename}")
+        _log.info("📊 Results saved to: %s", filename)
         return filename
     
+    def write_csv(self, jobs: Iterable[Dict], path: str):
+        """Stream jobs into a CSV file, one _CSV_FIELDS column each, leaving missing fields blank"""
+        with open(path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(_CSV_FIELDS)
+            writer.writerows(map(_csv_row, jobs))
+    
     def display_jobs(self, jobs: List[Dict]):
         """Display jobs in console"""
         print("\n📋 Job Results:")
@@ -957,12 +1288,7 @@ class SimpleJobSearch:
         
         for i, job in enumerate(jobs, 1):
             # Get source icon
-            if "linkedin" in job['source'].lower():
-                source_icon = "💼"
-            elif "timesjobs" in job['source'].lower():
-                source_icon = "📰"
-            else:
-                source_icon = "🔍"
+            source_icon = _SOURCE_ICONS[_SOURCE_CODES.get(job['source'], _SRC_OTHER)]
             
             print(f"\n{i}. {job['title']} [{source_icon} {job['source']}]")
             print(f"   🏢 Company: {job['company']}")
@@ -973,11 +1299,104 @@ class SimpleJobSearch:
                 print(f"   📝 Description: {job['description']}")
             print(f"   🔗 Apply: {job['apply_url']}")
 
+def _parse_apna_html(html) -> List[Dict]:
+    """Parse an Apna.co results page into job dicts"""
+    jobs = []
+    soup = _make_soup(html, _APNA_STRAINER)
+    
+    if _log.isEnabledFor(logging.DEBUG):
+        _log.debug("   Page loaded: %s", _page_title(html))
+    
+    # Find job cards on Apna.co
+    job_cards = SimpleJobSearch.find_apna_job_cards(soup)
+    
+    _log.debug("   Found %d job cards", len(job_cards))
+    
+    seen = set()
+    for i, card in enumerate(job_cards[:SimpleJobSearch.MAX_CARDS]):
+        job_data = SimpleJobSearch.parse_apna_job_card(card)
+        if job_data and _mark_seen(seen, job_data):
+            jobs.append(job_data)
+            _log.debug("   ✓ Parsed job %d: %s at %s", i + 1, job_data['title'], job_data['company'])
+    
+    return jobs
+
+def _parse_timesjobs_html(html, limit: int = SimpleJobSearch.MAX_CARDS) -> List[Dict]:
+    """Parse a TimesJobs results page into job dicts"""
+    jobs = []
+    soup = _make_soup(html, _TIMESJOBS_STRAINER)
+    
+    if _log.isEnabledFor(logging.DEBUG):
+        _log.debug("   Page loaded: %s", _page_title(html))
+    
+    # Find job cards on TimesJobs
+    job_cards = SimpleJobSearch.find_timesjobs_job_cards(soup, limit)
+    
+    _log.debug("   Found %d job cards", len(job_cards))
+    
+    seen = set()
+    for i, card in enumerate(job_cards[:limit]):
+        job_data = SimpleJobSearch.parse_timesjobs_job_card(card)
+        if job_data and _mark_seen(seen, job_data):
+            jobs.append(job_data)
+            _log.debug("   ✓ Parsed job %d: %s at %s", i + 1, job_data['title'], job_data['company'])
+    
+    return jobs
+
+def _parse_linkedin_html(html, limit: int = _LINKEDIN_MAX_CARDS) -> List[Dict]:
+    """Parse a LinkedIn results page into job dicts"""
+    soup = _make_soup(html, _LINKEDIN_STRAINER)
+    
+    jobs = []
+    for card in SimpleJobSearch.find_linkedin_job_cards(soup, limit):
+        job = SimpleJobSearch.parse_linkedin_job(card)
+        if job:
+            jobs.append(job)
+    
+    return jobs
+
+# Parsing holds the GIL, so result pages are parsed in worker processes, created on first use.
+# Only a handful of pages are in flight at once (and Windows refuses more than 61 workers)
+_PARSE_WORKERS = min(os.cpu_count() or 1, 4)
+_PARSE_TIMEOUT = 30.0
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
+
+def _init_parse_worker(level: int):
+    """Give a spawned parse worker the parent's log level so its debug output still shows"""
+    logging.basicConfig(level=level, format='%(message)s')
+
+def _parse_in_worker(parse, html, *args) -> List[Dict]:
+    """Run one of the module-level _parse_*_html functions in the parse process pool"""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(max_workers=_PARSE_WORKERS, initializer=_init_parse_worker,
+                                              initargs=(_log.getEffectiveLevel(),))
+        pool = _parse_pool
+    
+    try:
+        return pool.submit(parse, html, *args).result(timeout=_PARSE_TIMEOUT)
+    except (BrokenProcessPool, FutureTimeout) as e:
+        # A worker died or hung: start a fresh pool on the next call and parse this page here
+        _log.warning("⚠️ Parser process %s, restarting the parse pool",
+                     "timed out" if isinstance(e, FutureTimeout) else "exited unexpectedly")
+        with _parse_pool_lock:
+            if _parse_pool is pool:
+                _parse_pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+        return parse(html, *args)
+
 def main():
     """Main function to run job search"""
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     print("🤖 Simple Job Search Tool")
     print("=" * 30)
     
+    # Connect to the portals while the user is typing
+    searcher = SimpleJobSearch()
+    searcher.warm_up()
+    
     # Get user input
     job_title = input("Enter job title (e.g., Python Developer): ").strip()
     if not job_title:
@@ -988,7 +1407,6 @@ def main():
         location = "India"
     
     # Search jobs
-    searcher = SimpleJobSearch()
     jobs = searcher.search_jobs(job_title, location)
     
     if jobs:
@@ -1005,9 +1423,14 @@ def main():
 
 def main():
     """Main function to run job search"""
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     print("🤖 Simple Job Search Tool")
     print("=" * 30)
     
+    # Connect to the portals while the user is typing
+    searcher = SimpleJobSearch()
+    searcher.warm_up()
+    
     # Get user input
     job_title = input("Enter job title (e.g., Python Developer): ").strip()
     if not job_title:
@@ -1018,7 +1441,6 @@ def main():
         location = "India"
     
     # Search jobs
-    searcher = SimpleJobSearch()
     jobs = searcher.search_jobs(job_title, location)
     
     if jobs:
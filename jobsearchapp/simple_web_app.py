@@ -4,10 +4,63 @@ Simple Web Interface for Job Search
 """
 
 from flask import Flask, render_template, request, jsonify
+from flask.json.provider import JSONProvider
 from simple_job_search import SimpleJobSearch
+import atexit
+import logging
 import os
+import threading
+
+# Multi-threaded production WSGI server when installed, Flask's dev server otherwise
+try:
+    from waitress import serve
+except ImportError:
+    serve = None
+
+# C-backed JSON for request bodies and jsonify() responses when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, writing response bodies as bytes directly"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype='application/json')
+
+# Most result pages per portal a single /search may ask for
+_MAX_PAGES = 3
 
 app = Flask(__name__)
+if orjson:
+    app.json = OrjsonProvider(app)
+
+# One searcher for the whole process, so every request reuses its open
+# portal connections, worker threads and result cache. search_jobs keeps
+# fully live results for 15 minutes but never sample fallbacks, so repeat
+# queries skip scraping without pinning a failed search.
+#
+# It is built on first use: parse worker processes re-import this module
+# under spawn and must not each start their own threads and session
+SEARCHER = None
+_searcher_lock = threading.Lock()
+
+def get_searcher() -> SimpleJobSearch:
+    """Return the shared searcher, creating it on first call"""
+    global SEARCHER
+    with _searcher_lock:
+        if SEARCHER is None:
+            SEARCHER = SimpleJobSearch()
+            atexit.register(SEARCHER.close)
+    return SEARCHER
 
 @app.route('/')
 def index():
@@ -23,9 +76,13 @@ def search_jobs():
         if not job_title:
             return jsonify({'error': 'Job title is required'}), 400
         
+        try:
+            pages = min(max(int(data.get('pages', 1)), 1), _MAX_PAGES)
+        except (TypeError, ValueError):
+            return jsonify({'error': 'pages must be a whole number'}), 400
+        
         # Search jobs
-        searcher = SimpleJobSearch()
-        jobs = searcher.search_jobs(job_title, location)
+        jobs = get_searcher().search_jobs(job_title, location, pages)
         
         return jsonify({
             'success': True,
@@ -40,4 +97,9 @@ def search_jobs():
         }), 500
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5000)
\ No newline at end of file
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    get_searcher().warm_up()
+    if serve:
+        serve(app, host='127.0.0.1', port=5000, threads=8)
+    else:
+        app.run(debug=True, port=5000, threaded=True)
\ No newline at end of file